@@ -1,10 +1,11 @@
 import time
+_start_time = time.perf_counter()
 from functools import partial
 import os
 import sys
+import argparse
 
 import numpy as np
-from astropy.io import fits
 import datetime
 # from astropy import wcs, utils
 # import astropy.units as u
@@ -17,11 +18,11 @@ from ginga import cmap
 from ginga.misc import log
 from ginga.qtw.QtHelp import QtGui, QtCore
 from ginga.qtw.ImageViewQt import CanvasView
-from ginga.util import plots
 # from ginga.util.io import io_fits
-from ginga.util.loader import load_data
 # from ginga.AstroImage import AstroImage
-from ginga.gw import Plot, Widgets
+from ginga.gw import Widgets
+
+_import_time = time.perf_counter() - _start_time
 
 class FileWriter(Widgets.Box):
     def __init__(self, logger, points):
@@ -99,6 +100,10 @@ class Cuts(Widgets.Box):
 
         self.gui_up = False
 
+        # matplotlib is only pulled in once the cuts window is opened
+        from ginga.util import plots
+        from ginga.gw import Plot
+
         vbox = Widgets.VBox()
 
         self.cuts_plot = plots.CutsPlot(logger=self.logger,
@@ -436,26 +441,15 @@ class FitsViewer(QtGui.QMainWindow):
         item.triggered.connect(self.cuts_popup)
         cutmenu.addAction(item)
 
+        # these menus are filled in the first time they are opened
         colormenu = menubar.addMenu("Colors")
-        for cm_name in cmap.get_names():
-            item = QtGui.QAction(cm_name, menubar)
-            
-            item.triggered.connect(partial(self.cmap_change, cm_name))
-            colormenu.addAction(item)
+        self.lazy_menu(colormenu, cmap.get_names, self.cmap_change)
 
         cutmenu = menubar.addMenu("Display Parameters")
-        for cut_name in fi.get_autocut_methods():
-            item = QtGui.QAction(cut_name, menubar)
-            
-            item.triggered.connect(partial(self.cut_change, cut_name))
-            cutmenu.addAction(item)
+        self.lazy_menu(cutmenu, fi.get_autocut_methods, self.cut_change)
 
         cutmenu = menubar.addMenu("Stretch")
-        for stretch_name in fi.get_color_algorithms():
-            item = QtGui.QAction(stretch_name, menubar)
-            
-            item.triggered.connect(partial(self.color_change, stretch_name))
-            cutmenu.addAction(item)
+        self.lazy_menu(cutmenu, fi.get_color_algorithms, self.color_change)
 
 
         
@@ -561,6 +555,21 @@ class FitsViewer(QtGui.QMainWindow):
         # return RecCanvas, CompCanvas
         return RecCanvas
 
+    def lazy_menu(self, menu, get_names, callback):
+        # Populate menu with an action per name the first time it is shown
+        def populate():
+            try:
+                names = get_names()
+            except Exception as e:
+                self.logger.error(f"Could not fill {menu.title()} menu: {e}")
+                return
+            for name in names:
+                item = QtGui.QAction(name, menu)
+                item.triggered.connect(partial(callback, name))
+                menu.addAction(item)
+            menu.aboutToShow.disconnect(populate)
+        menu.aboutToShow.connect(populate)
+
     def cmap_change(self, cm_name):
         self.fitsimage.set_color_map(cm_name)
 
@@ -614,6 +623,9 @@ class FitsViewer(QtGui.QMainWindow):
         QtGui.QApplication.instance().quit()
 
     def load_file(self, filepath):
+            # only needed once a file is opened, not before the first frame
+            from astropy.io import fits
+            from ginga.util.loader import load_data
             filepath = os.path.join(filepath, filepath)
             fitsData = fits.getdata(filepath)
             header = fits.getheader(filepath)
@@ -650,6 +662,7 @@ class FitsViewer(QtGui.QMainWindow):
         self.c.show()
 
     def writeFits(self, headerinfo, image_data):
+        from astropy.io import fits
         hdu = fits.PrimaryHDU(header=headerinfo, data=image_data)
         filename = 'subImage.fits'
         try:
@@ -680,15 +693,75 @@ class FitsViewer(QtGui.QMainWindow):
         self.fitsimage.set_pan(data_x, data_y)
         # self.pickstar(self.fitsimage)
 
+class StartupTimer(QtCore.QObject):
+    """Event filter that stops the first-paint clock on the first paint
+    event of the watched widget, then reports the startup times and quits.
+
+    If `budget_ms` is given and the total startup time exceeds it, the
+    application exits with a non-zero status. If no paint is seen within
+    `timeout_ms` it reports that and exits with status 2.
+    """
+
+    def __init__(self, window_time, show_time, budget_ms=None, timeout_ms=30000):
+        super(StartupTimer, self).__init__()
+        self.window_time = window_time
+        self.show_time = show_time
+        self.budget_ms = budget_ms
+        self.first_paint = None
+        # don't hang forever if the viewer is never painted (offscreen, minimized)
+        QtCore.QTimer.singleShot(timeout_ms, self.no_paint)
+
+    def eventFilter(self, obj, event):
+        if self.first_paint is None and event.type() == QtCore.QEvent.Paint:
+            self.first_paint = time.perf_counter() - self.show_time
+            # report after this paint event has been handled
+            QtCore.QTimer.singleShot(0, self.report)
+        return False
+
+    def no_paint(self):
+        if self.first_paint is not None:
+            return
+        print("startup_ms error=no_first_paint")
+        QtGui.QApplication.instance().exit(2)
+
+    def report(self):
+        total = (time.perf_counter() - _start_time) * 1000
+        print(f"startup_ms imports={_import_time * 1000:.1f} "
+              f"window={self.window_time * 1000:.1f} "
+              f"first_paint={self.first_paint * 1000:.1f} total={total:.1f}")
+        status = 0
+        if self.budget_ms is not None and total > self.budget_ms:
+            print(f"Startup took {total:.1f} ms, over budget of {self.budget_ms:.1f} ms")
+            status = 1
+        QtGui.QApplication.instance().exit(status)
+
 def main():
-    app = QtGui.QApplication([])
+    parser = argparse.ArgumentParser(description="Drift Extractor")
+    parser.add_argument("--startup-benchmark", action="store_true",
+                        help="report import, window construction and first paint times, then exit")
+    parser.add_argument("--startup-budget-ms", type=float, default=None,
+                        help="with --startup-benchmark, exit with status 1 if total startup exceeds this")
+    args, qt_args = parser.parse_known_args()
+    unknown = [arg for arg in qt_args if arg.startswith("--startup")]
+    if unknown:
+        parser.error(f"unrecognized arguments: {' '.join(unknown)}")
+    if args.startup_budget_ms is not None and not args.startup_benchmark:
+        parser.error("--startup-budget-ms requires --startup-benchmark")
+
+    app = QtGui.QApplication(sys.argv[:1] + qt_args)
 
     # ginga needs a logger.
     # If you don't want to log anything you can create a null logger by
     # using null=True in this call instead of log_stderr=True
     logger = log.get_logger("DriftExtracter", log_stderr=True, level=40, log_file="DE.log")
+    window_start = time.perf_counter()
     w = FitsViewer(logger)
+    window_time = time.perf_counter() - window_start
     w.resize(1000,950)
+    show_time = time.perf_counter()
+    if args.startup_benchmark:
+        timer = StartupTimer(window_time, show_time, args.startup_budget_ms)
+        w.fitsimage.get_widget().installEventFilter(timer)
     w.show()
     app.setActiveWindow(w)
     w.raise_()